@@ -2,36 +2,91 @@
 """
 Auto-reloading development server for Beanie Dash
 Watches for file changes and automatically restarts the server
+Uses watchdog (inotify/FSEvents) when installed, otherwise polls file mtimes
 """
 
 import os
 import sys
+import argparse
 import time
 import subprocess
 import threading
-from http.server import HTTPServer, SimpleHTTPRequestHandler
+from http.server import ThreadingHTTPServer, SimpleHTTPRequestHandler
 from pathlib import Path
 
+try:
+    from watchdog.observers import Observer
+    from watchdog.observers.polling import PollingObserver
+    from watchdog.events import FileSystemEventHandler
+    HAS_WATCHDOG = True
+except ImportError:
+    FileSystemEventHandler = object
+    HAS_WATCHDOG = False
+
+class QuietRequestHandler(SimpleHTTPRequestHandler):
+    """Static file handler that keeps connections alive and doesn't log requests"""
+    protocol_version = 'HTTP/1.1'  # Keep connections alive between asset requests
+
+    def log_message(self, format, *args):
+        pass  # Suppress request logs for cleaner output
+
+class QuietHTTPServer(ThreadingHTTPServer):
+    """Threaded HTTP server that ignores clients dropping keep-alive connections"""
+    def handle_error(self, request, client_address):
+        if isinstance(sys.exc_info()[1], (ConnectionResetError, BrokenPipeError)):
+            return
+        super().handle_error(request, client_address)
+
+class ChangeHandler(FileSystemEventHandler):
+    """Forward file system events to the dev server"""
+    def __init__(self, server):
+        self.server = server
+
+    def on_modified(self, event):
+        if not event.is_directory and self.server.should_watch(event.src_path):
+            self.server.on_file_changed(event.src_path)
+
+    def on_created(self, event):
+        if not event.is_directory and self.server.should_watch(event.src_path):
+            self.server.on_file_changed(event.src_path)
+
+    def on_moved(self, event):
+        # Atomic saves write a temp file and rename it over the target
+        if not event.is_directory and self.server.should_watch(event.dest_path):
+            self.server.on_file_changed(event.dest_path)
+
 class DevServer:
-    def __init__(self, port=8000):
+    def __init__(self, port=8000, poll_interval=2.0):
         self.port = port
+        self.poll_interval = poll_interval  # Seconds between polling scans
         self.server = None
         self.server_thread = None
-        self.watch_extensions = {'.html', '.js', '.css', '.json'}
+        self.watch_extensions = ('.html', '.js', '.css', '.json')  # Tuple for str.endswith
         self.ignore_dirs = {'.git', 'node_modules', '.beads', '__pycache__'}
         self.last_modified = {}
+        self.file_cache = None  # Watched file paths, None forces a re-walk
+        self.dir_mtimes = {}
         self.running = False
+        self.observer = None
+        self.last_reload = 0
+        self.reload_delay = 1  # Debounce delay in seconds
+        self.restart_lock = threading.Lock()
 
     def start_server(self):
         """Start the HTTP server in a separate thread"""
         print(f"\n🚀 Starting server on http://localhost:{self.port}")
         print("📁 Serving from:", os.getcwd())
-        print("👀 Watching for changes in: .html, .js, .css, .json files")
+        print("👀 Watching for changes in: .html, .js, .css, .json files"
+              f" ({'watchdog' if HAS_WATCHDOG else 'polling'})")
+        if not HAS_WATCHDOG:
+            print(f"⏱️  Polling every {self.poll_interval}s"
+                  " (raise --watch-interval for large trees or network mounts,"
+                  " lower it for faster reloads)")
         print("🔄 Server will auto-restart on file changes")
         print("⚡ Press Ctrl+C to stop\n")
 
-        handler = SimpleHTTPRequestHandler
-        self.server = HTTPServer(('', self.port), handler)
+        # Serve each request on its own thread so asset loads run in parallel
+        self.server = QuietHTTPServer(('', self.port), QuietRequestHandler)
         self.server_thread = threading.Thread(target=self.server.serve_forever)
         self.server_thread.daemon = True
         self.server_thread.start()
@@ -42,72 +97,151 @@ class DevServer:
         if self.server:
             print("🔄 Restarting server...")
             self.server.shutdown()
+            self.server.server_close()  # Release the port for the restarted server
             self.server_thread.join(timeout=1)
             self.running = False
 
-    def get_files_to_watch(self):
-        """Get all files that should be watched for changes"""
-        files = []
-        for root, dirs, filenames in os.walk('.'):
-            # Remove ignored directories from dirs list (modifies in-place)
-            dirs[:] = [d for d in dirs if d not in self.ignore_dirs]
+    def restart(self, changed):
+        """Restart the server after the given files changed"""
+        with self.restart_lock:
+            print(f"\n✏️  Detected changes in: {', '.join(str(f) for f in changed)}")
+            self.stop_server()
+            time.sleep(0.5)  # Brief pause before restart
+            self.start_server()
+
+    def should_watch(self, path):
+        """Check if a changed path should trigger a reload"""
+        if not path.endswith(self.watch_extensions):
+            return False
+        return not any(part in self.ignore_dirs for part in Path(path).parts)
 
-            for filename in filenames:
-                if any(filename.endswith(ext) for ext in self.watch_extensions):
-                    filepath = Path(root) / filename
-                    files.append(filepath)
-        return files
+    def on_file_changed(self, path):
+        """Handle a watchdog event, debouncing bursts of saves"""
+        current_time = time.monotonic()
+        if current_time - self.last_reload > self.reload_delay and self.running:
+            self.last_reload = current_time
+            self.restart([path])
+
+    def start_observer(self):
+        """Start an event-driven watcher, falling back to watchdog's poller"""
+        handler = ChangeHandler(self)
+        try:
+            self.observer = Observer()
+            self.observer.schedule(handler, path='.', recursive=True)
+            self.observer.start()
+        except OSError:
+            # inotify unavailable (e.g. watch limit reached)
+            print("⚠️  Native file watching unavailable, falling back to polling")
+            self.observer = PollingObserver(timeout=self.poll_interval)
+            self.observer.schedule(handler, path='.', recursive=True)
+            self.observer.start()
+
+    def get_files_to_watch(self, root='.'):
+        """Yield (path, mtime_ns) for every watched file under root"""
+        try:
+            # Record the directory mtime first so entries added mid-walk are caught next scan
+            self.dir_mtimes[root] = os.stat(root).st_mtime_ns
+            entries = os.scandir(root)
+        except OSError:
+            # Directory might have been deleted or be unreadable
+            return
+        with entries:
+            for entry in entries:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        if entry.name not in self.ignore_dirs:
+                            yield from self.get_files_to_watch(entry.path)
+                    elif entry.name.endswith(self.watch_extensions) and entry.is_file():
+                        # is_dir()/is_file() use the file type from the directory read and
+                        # need no extra syscall; stat() is called once per watched file
+                        yield entry.path, entry.stat().st_mtime_ns
+                except OSError:
+                    # File might have been deleted or moved
+                    pass
+
+    def stat_cached_files(self):
+        """Yield (path, mtime_ns) for every file in the cached file list"""
+        for path in self.file_cache:
+            try:
+                yield path, os.stat(path).st_mtime_ns
+            except FileNotFoundError:
+                # File was deleted or moved, re-walk the tree on the next scan
+                self.file_cache = None
+            except OSError:
+                pass
+
+    def dirs_changed(self):
+        """Check if any watched directory has gained, lost or renamed entries"""
+        for path, mtime in self.dir_mtimes.items():
+            try:
+                if os.stat(path).st_mtime_ns != mtime:
+                    return True
+            except OSError:
+                return True
+        return False
 
     def check_for_changes(self):
         """Check if any watched files have been modified"""
+        # Directory mtimes only change when entries are added, removed or renamed,
+        # so re-walk the tree only then; otherwise just stat the known files
+        if self.file_cache is None or self.dirs_changed():
+            self.dir_mtimes = {}
+            scanned = list(self.get_files_to_watch())
+            self.file_cache = [path for path, _ in scanned]
+        else:
+            scanned = self.stat_cached_files()
+
         changed_files = []
-        for filepath in self.get_files_to_watch():
-            try:
-                mtime = filepath.stat().st_mtime
-                if str(filepath) in self.last_modified:
-                    if mtime > self.last_modified[str(filepath)]:
-                        changed_files.append(filepath)
-                self.last_modified[str(filepath)] = mtime
-            except (OSError, IOError):
-                # File might have been deleted or moved
-                pass
+        for path, mtime in scanned:
+            if path in self.last_modified and mtime > self.last_modified[path]:
+                changed_files.append(path)
+            self.last_modified[path] = mtime
         return changed_files
 
     def run(self):
         """Main loop - start server and watch for changes"""
         try:
-            # Initial file scan
-            self.check_for_changes()
+            if HAS_WATCHDOG:
+                self.start_server()
+                self.start_observer()
 
-            # Start server
-            self.start_server()
+                # Keep running until interrupted
+                while True:
+                    time.sleep(1)
+            else:
+                # Without watchdog, poll file mtimes
+                self.check_for_changes()  # Initial file scan
+                self.start_server()
 
-            while True:
-                time.sleep(1)  # Check every second
+                while True:
+                    time.sleep(self.poll_interval)
 
-                changed = self.check_for_changes()
-                if changed and self.running:
-                    print(f"\n✏️  Detected changes in: {', '.join(str(f) for f in changed)}")
-                    self.stop_server()
-                    time.sleep(0.5)  # Brief pause before restart
-                    self.start_server()
+                    changed = self.check_for_changes()
+                    if changed and self.running:
+                        self.restart(changed)
 
         except KeyboardInterrupt:
             print("\n\n👋 Shutting down server...")
+            if self.observer:
+                self.observer.stop()
+                self.observer.join()
             if self.server:
                 self.server.shutdown()
             sys.exit(0)
 
 def main():
-    # Parse port from command line if provided
-    port = 8000
-    if len(sys.argv) > 1:
-        try:
-            port = int(sys.argv[1])
-        except ValueError:
-            print(f"Invalid port: {sys.argv[1]}")
-            print("Usage: python dev_server.py [port]")
-            sys.exit(1)
+    parser = argparse.ArgumentParser(description="Auto-reloading development server for Beanie Dash")
+    parser.add_argument('port_arg', nargs='?', type=int, metavar='port',
+                        help="port to serve on (default: 8000)")
+    parser.add_argument('--port', type=int,
+                        help="port to serve on (default: 8000)")
+    parser.add_argument('--watch-interval', type=float, default=2.0,
+                        help="seconds between file scans when polling (default: 2.0)")
+    args = parser.parse_args()
+
+    port = args.port or args.port_arg or 8000
+    if args.watch_interval <= 0:
+        parser.error("--watch-interval must be positive")
 
     # Check if another process is using the port
     import socket
@@ -121,7 +255,7 @@ def main():
         sys.exit(1)
 
     # Start the development server
-    server = DevServer(port)
+    server = DevServer(port, poll_interval=args.watch_interval)
     server.run()
 
 if __name__ == "__main__":
@@ -9,7 +9,7 @@ import sys
 import time
 import subprocess
 import threading
-from http.server import HTTPServer, SimpleHTTPRequestHandler
+from http.server import ThreadingHTTPServer, SimpleHTTPRequestHandler
 
 try:
     from watchdog.observers import Observer
@@ -20,6 +20,20 @@ except ImportError:
     print("Or use the basic dev_server.py instead")
     sys.exit(1)
 
+class QuietRequestHandler(SimpleHTTPRequestHandler):
+    """Static file handler that keeps connections alive and doesn't log requests"""
+    protocol_version = 'HTTP/1.1'  # Keep connections alive between asset requests
+
+    def log_message(self, format, *args):
+        pass  # Suppress request logs for cleaner output
+
+class QuietHTTPServer(ThreadingHTTPServer):
+    """Threaded HTTP server that ignores clients dropping keep-alive connections"""
+    def handle_error(self, request, client_address):
+        if isinstance(sys.exc_info()[1], (ConnectionResetError, BrokenPipeError)):
+            return
+        super().handle_error(request, client_address)
+
 class FileChangeHandler(FileSystemEventHandler):
     def __init__(self, server):
         self.server = server
@@ -29,8 +43,8 @@ class FileChangeHandler(FileSystemEventHandler):
     def should_reload(self, path):
         """Check if file change should trigger reload"""
         # Check extension
-        extensions = {'.html', '.js', '.css', '.json', '.md'}
-        if not any(path.endswith(ext) for ext in extensions):
+        extensions = ('.html', '.js', '.css', '.json', '.md')
+        if not path.endswith(extensions):
             return False
 
         # Ignore certain directories
@@ -72,10 +86,8 @@ class DevServerWatchdog:
         print("🔄 Server will auto-restart on file changes")
         print("⚡ Press Ctrl+C to stop\n")
 
-        handler = SimpleHTTPRequestHandler
-        handler.log_message = lambda *args: None  # Suppress request logs for cleaner output
-
-        self.server = HTTPServer(('', self.port), handler)
+        # Serve each request on its own thread so asset loads run in parallel
+        self.server = QuietHTTPServer(('', self.port), QuietRequestHandler)
         self.server_thread = threading.Thread(target=self.server.serve_forever)
         self.server_thread.daemon = True
         self.server_thread.start()
@@ -84,6 +96,7 @@ class DevServerWatchdog:
         """Stop the HTTP server"""
         if self.server:
             self.server.shutdown()
+            self.server.server_close()  # Release the port for the restarted server
             self.server_thread.join(timeout=1)
             self.server = None
 
@@ -8,24 +8,50 @@ import numpy as np
 import wave
 import struct
 import os
+import subprocess
+from concurrent.futures import ThreadPoolExecutor
 
-def create_wav_file(filename, audio_data, sample_rate=44100):
-    """Create a WAV file from audio data"""
-    # Normalize audio to prevent clipping
-    audio_data = np.clip(audio_data, -1, 1)
+def to_pcm16(audio_data, chunk_size=1 << 15):
+    """Yield audio data as 16-bit little-endian PCM bytes, one chunk at a time"""
+    # Convert in chunks so only a small int16 buffer exists at a time
+    for start in range(0, len(audio_data), chunk_size):
+        # Normalize audio to prevent clipping
+        chunk = np.clip(audio_data[start:start + chunk_size], -1, 1)
 
-    # Convert to 16-bit integer
-    audio_data_int = (audio_data * 32767).astype(np.int16)
+        # Convert to 16-bit integer
+        chunk *= 32767
+        yield chunk.astype('<i2').tobytes()
 
+def create_wav_file(filename, audio_data, sample_rate=44100):
+    """Create a WAV file from audio data"""
     # Write WAV file
     with wave.open(filename, 'wb') as wav_file:
         wav_file.setnchannels(1)  # Mono
         wav_file.setsampwidth(2)   # 16-bit
         wav_file.setframerate(sample_rate)
-        wav_file.writeframes(audio_data_int.tobytes())
+
+        # The header's frame count is patched when the file is closed
+        for pcm in to_pcm16(audio_data):
+            wav_file.writeframesraw(pcm)
 
     print(f"✅ Created {filename}")
 
+def convert_audio(audio_data, out_file, sample_rate=44100):
+    """Encode audio data with ffmpeg via stdin, returning True on success"""
+    process = subprocess.Popen(['ffmpeg', '-loglevel', 'error',
+                                '-f', 's16le', '-ar', str(sample_rate), '-ac', '1', '-i', 'pipe:0',
+                                '-y', out_file],
+                               stdin=subprocess.PIPE, stdout=subprocess.DEVNULL,
+                               stderr=subprocess.DEVNULL, bufsize=0)
+    try:
+        for pcm in to_pcm16(audio_data):
+            process.stdin.write(pcm)
+    except BrokenPipeError:
+        pass  # ffmpeg exited early, reported through its return code
+    finally:
+        process.stdin.close()
+    return process.wait() == 0
+
 def generate_jump_sound(sample_rate=44100):
     """Generate a quick upward sweep jump sound"""
     duration = 0.2  # 200ms
@@ -37,11 +63,14 @@ def generate_jump_sound(sample_rate=44100):
     # Quick decay envelope
     envelope = np.exp(-t * 10)
 
+    # Phase of the fundamental, reused for the harmonic
+    phase = 2 * np.pi * frequency * t
+
     # Generate the sound (sine wave with frequency sweep)
-    sound = np.sin(2 * np.pi * frequency * t) * envelope * 0.3
+    sound = np.sin(phase) * envelope * 0.3
 
     # Add a second harmonic for richness
-    sound += np.sin(4 * np.pi * frequency * t) * envelope * 0.1
+    sound += np.sin(2 * phase) * envelope * 0.1
 
     return sound
 
@@ -56,8 +85,11 @@ def generate_death_sound(sample_rate=44100):
     # Decay envelope
     envelope = np.exp(-t * 2)
 
+    # Phase of the main tone, reused for the sub-bass
+    phase = 2 * np.pi * frequency * t
+
     # Main tone
-    sound = np.sin(2 * np.pi * frequency * t) * envelope * 0.3
+    sound = np.sin(phase) * envelope * 0.3
 
     # Add glitch effect (random noise bursts)
     noise = np.random.random(len(t)) - 0.5
@@ -65,7 +97,7 @@ def generate_death_sound(sample_rate=44100):
     sound += noise * glitch_mask * envelope * 0.2
 
     # Add sub-bass
-    sound += np.sin(2 * np.pi * frequency * 0.25 * t) * envelope * 0.2
+    sound += np.sin(phase * 0.25) * envelope * 0.2
 
     return sound
 
@@ -77,32 +109,58 @@ def generate_background_music(sample_rate=44100):
     bpm = 120
     beat_duration = 60 / bpm
 
-    # Create the music
-    music = np.zeros(len(t))
-
     # Bass line - simple pattern
-    bass_frequencies = [65, 65, 69, 69, 72, 72, 65, 65]  # Hz values
-    for i, time in enumerate(t):
-        beat_index = int((time / beat_duration) % 8)
-        bass_freq = bass_frequencies[beat_index]
-
-        # Bass
-        music[i] += np.sin(2 * np.pi * bass_freq * time) * 0.2
-
-        # Kick drum (every half second)
-        kick_envelope = np.exp(-(time % 0.5) * 20)
-        music[i] += np.sin(2 * np.pi * 55 * time) * kick_envelope * 0.3
-
-        # Hi-hat (16th notes)
-        hihat_envelope = np.exp(-(time % 0.125) * 100)
-        music[i] += (np.random.random() - 0.5) * hihat_envelope * 0.05
-
-        # Simple arpeggiator
-        arp_freq = bass_freq * 4 * (1 + int((time * 8) % 4) * 0.25)
-        music[i] += np.sin(2 * np.pi * arp_freq * time) * 0.05
+    bass_frequencies = np.array([65, 65, 69, 69, 72, 72, 65, 65], dtype=np.float64)  # Hz values
+    beat_index = (t / beat_duration).astype(np.int64) % 8
+    bass_freq = bass_frequencies[beat_index]
+
+    # Compute each voice into reusable buffers (out=) instead of allocating
+    # fresh temporaries for every operation
+    omega_t = 2 * np.pi * t  # Angular time, shared by every voice
+    envelope = np.empty_like(t)
+    voice = np.empty_like(t)
+
+    # Bass
+    music = np.multiply(omega_t, bass_freq)
+    np.sin(music, out=music)
+    music *= 0.2
+
+    # Kick drum (every half second)
+    np.remainder(t, 0.5, out=envelope)
+    envelope *= -20
+    np.exp(envelope, out=envelope)
+    np.multiply(omega_t, 55, out=voice)
+    np.sin(voice, out=voice)
+    voice *= envelope
+    voice *= 0.3
+    music += voice
+
+    # Hi-hat (16th notes)
+    np.remainder(t, 0.125, out=envelope)
+    envelope *= -100
+    np.exp(envelope, out=envelope)
+    noise = np.random.random(len(t))
+    noise -= 0.5
+    noise *= envelope
+    noise *= 0.05
+    music += noise
+
+    # Simple arpeggiator
+    np.multiply(t, 8, out=voice)
+    np.remainder(voice, 4, out=voice)
+    np.floor(voice, out=voice)
+    voice *= 0.25
+    voice += 1
+    voice *= bass_freq
+    voice *= 4  # Arpeggio frequency
+    voice *= omega_t
+    np.sin(voice, out=voice)
+    voice *= 0.05
+    music += voice
 
     # Soft clipping to prevent distortion
-    music = np.tanh(music * 0.8)
+    music *= 0.8
+    np.tanh(music, out=music)
 
     return music
 
@@ -137,26 +195,20 @@ def main():
 
     # Try to convert with ffmpeg if available
     try:
-        import subprocess
-
         print("\n🔄 Attempting to convert with ffmpeg...")
 
-        for base_name in ['jump', 'death', 'background']:
-            wav_file = f'assets/audio/{base_name}.wav'
-            mp3_file = f'assets/audio/{base_name}.mp3'
-            ogg_file = f'assets/audio/{base_name}.ogg'
-
-            # Convert to MP3
-            result = subprocess.run(['ffmpeg', '-i', wav_file, '-y', mp3_file],
-                                  capture_output=True, text=True)
-            if result.returncode == 0:
-                print(f"✅ Created {mp3_file}")
-
-            # Convert to OGG
-            result = subprocess.run(['ffmpeg', '-i', wav_file, '-y', ogg_file],
-                                  capture_output=True, text=True)
-            if result.returncode == 0:
-                print(f"✅ Created {ogg_file}")
+        # Feed the samples to ffmpeg directly rather than re-reading the WAV files.
+        # Each ffmpeg process is single-threaded for these short clips, so run them side by side
+        sounds = {'jump': jump_sound, 'death': death_sound, 'background': background_music}
+        jobs = [(audio_data, f'assets/audio/{base_name}.{ext}')
+                for base_name, audio_data in sounds.items()
+                for ext in ['mp3', 'ogg']]
+        with ThreadPoolExecutor(max_workers=len(jobs)) as executor:
+            results = list(executor.map(lambda job: convert_audio(*job), jobs))
+
+        for (_, out_file), success in zip(jobs, results):
+            if success:
+                print(f"✅ Created {out_file}")
 
         print("\n✨ All conversions complete!")
 
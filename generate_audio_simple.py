@@ -9,6 +9,8 @@ import struct
 import math
 import random
 import os
+import subprocess
+from concurrent.futures import ThreadPoolExecutor
 
 def create_wav_file(filename, audio_data, sample_rate=44100):
     """Create a WAV file from audio data"""
@@ -18,17 +20,14 @@ def create_wav_file(filename, audio_data, sample_rate=44100):
         wav_file.setsampwidth(2)   # 16-bit
         wav_file.setframerate(sample_rate)
 
-        # Convert float audio data to 16-bit integers
-        frames = []
-        for sample in audio_data:
-            # Clip to [-1, 1] range
-            sample = max(-1, min(1, sample))
-            # Convert to 16-bit integer
-            int_sample = int(sample * 32767)
-            # Pack as bytes
-            frames.append(struct.pack('<h', int_sample))
+        # Clip to [-1, 1] range and pack as 16-bit integers straight into a preallocated buffer
+        frames = bytearray(len(audio_data) * 2)
+        pack_into = struct.Struct('<h').pack_into
+        for i, sample in enumerate(audio_data):
+            int_sample = 32767 if sample > 1 else -32767 if sample < -1 else int(sample * 32767)
+            pack_into(frames, i * 2, int_sample)
 
-        wav_file.writeframes(b''.join(frames))
+        wav_file.writeframes(frames)
 
     print(f"✅ Created {filename}")
 
@@ -36,24 +35,23 @@ def generate_jump_sound(sample_rate=44100):
     """Generate a quick upward sweep jump sound"""
     duration = 0.2  # 200ms
     num_samples = int(sample_rate * duration)
-    audio_data = []
+    sin, exp = math.sin, math.exp
+    two_pi, four_pi = 2 * math.pi, 4 * math.pi
 
-    for i in range(num_samples):
-        t = i / sample_rate
+    # Build each component as a whole list rather than sample by sample
+    times = [i / sample_rate for i in range(num_samples)]
 
-        # Frequency sweep from 200Hz to 1000Hz
-        frequency = 200 + (800 * (i / num_samples))
+    # Frequency sweep from 200Hz to 1000Hz
+    frequencies = [200 + (800 * (i / num_samples)) for i in range(num_samples)]
 
-        # Quick decay envelope
-        envelope = math.exp(-t * 10)
+    # Quick decay envelope
+    envelopes = [exp(-t * 10) for t in times]
 
-        # Generate the sound (sine wave with frequency sweep)
-        sample = math.sin(2 * math.pi * frequency * t) * envelope * 0.3
-
-        # Add a second harmonic for richness
-        sample += math.sin(4 * math.pi * frequency * t) * envelope * 0.1
-
-        audio_data.append(sample)
+    audio_data = [
+        # Sine wave with frequency sweep, plus a second harmonic for richness
+        sin(two_pi * f * t) * env * 0.3 + sin(four_pi * f * t) * env * 0.1
+        for t, f, env in zip(times, frequencies, envelopes)
+    ]
 
     return audio_data
 
@@ -61,28 +59,26 @@ def generate_death_sound(sample_rate=44100):
     """Generate a descending glitchy death sound"""
     duration = 0.8  # 800ms
     num_samples = int(sample_rate * duration)
-    audio_data = []
+    sin, exp, rand = math.sin, math.exp, random.random
+    two_pi = 2 * math.pi
 
-    for i in range(num_samples):
-        t = i / sample_rate
+    times = [i / sample_rate for i in range(num_samples)]
 
-        # Exponentially decaying frequency
-        frequency = 800 * math.exp(-t * 3)
+    # Exponentially decaying frequency
+    frequencies = [800 * exp(-t * 3) for t in times]
 
-        # Decay envelope
-        envelope = math.exp(-t * 2)
+    # Decay envelope
+    envelopes = [exp(-t * 2) for t in times]
 
+    audio_data = [
         # Main tone
-        sample = math.sin(2 * math.pi * frequency * t) * envelope * 0.3
-
-        # Add glitch effect (random noise bursts)
-        if random.random() < 0.1:  # 10% chance of glitch
-            sample += (random.random() - 0.5) * envelope * 0.2
-
+        sin(two_pi * f * t) * env * 0.3
+        # Add glitch effect (random noise bursts, 10% chance of glitch)
+        + ((rand() - 0.5) * env * 0.2 if rand() < 0.1 else 0)
         # Add sub-bass
-        sample += math.sin(2 * math.pi * frequency * 0.25 * t) * envelope * 0.2
-
-        audio_data.append(sample)
+        + sin(two_pi * f * 0.25 * t) * env * 0.2
+        for t, f, env in zip(times, frequencies, envelopes)
+    ]
 
     return audio_data
 
@@ -90,7 +86,8 @@ def generate_background_music(sample_rate=44100):
     """Generate a simple synthwave-style background loop"""
     duration = 8.0  # 8 second loop
     num_samples = int(sample_rate * duration)
-    audio_data = []
+    sin, exp, tanh, rand = math.sin, math.exp, math.tanh, random.random
+    two_pi = 2 * math.pi
 
     bpm = 120
     beat_duration = 60 / bpm
@@ -98,62 +95,52 @@ def generate_background_music(sample_rate=44100):
     # Bass line pattern (frequencies in Hz)
     bass_frequencies = [65, 65, 69, 69, 72, 72, 65, 65]
 
-    for i in range(num_samples):
-        time = i / sample_rate
-
-        # Determine current beat
-        beat_index = int((time / beat_duration) % 8)
-        bass_freq = bass_frequencies[beat_index]
-
-        # Bass
-        sample = math.sin(2 * math.pi * bass_freq * time) * 0.2
+    times = [i / sample_rate for i in range(num_samples)]
 
-        # Kick drum (every half second)
-        kick_envelope = math.exp(-(time % 0.5) * 20)
-        sample += math.sin(2 * math.pi * 55 * time) * kick_envelope * 0.3
-
-        # Hi-hat (16th notes)
-        hihat_envelope = math.exp(-(time % 0.125) * 100)
-        sample += (random.random() - 0.5) * hihat_envelope * 0.05
-
-        # Simple arpeggiator
-        arp_freq = bass_freq * 4 * (1 + int((time * 8) % 4) * 0.25)
-        sample += math.sin(2 * math.pi * arp_freq * time) * 0.05
+    # Bass note for the current beat of each sample
+    bass = [bass_frequencies[int((time / beat_duration) % 8)] for time in times]
 
+    audio_data = [
         # Soft clipping to prevent distortion
-        sample = math.tanh(sample * 0.8)
-
-        audio_data.append(sample)
+        tanh((
+            # Bass
+            sin(two_pi * bass_freq * time) * 0.2
+            # Kick drum (every half second)
+            + sin(two_pi * 55 * time) * exp(-(time % 0.5) * 20) * 0.3
+            # Hi-hat (16th notes), noise drawn inline via the local rand binding;
+            # a separate pre-drawn noise list measured slower than this
+            + (rand() - 0.5) * exp(-(time % 0.125) * 100) * 0.05
+            # Simple arpeggiator
+            + sin(two_pi * (bass_freq * 4 * (1 + int((time * 8) % 4) * 0.25)) * time) * 0.05
+        ) * 0.8)
+        for time, bass_freq in zip(times, bass)
+    ]
 
     return audio_data
 
+def convert_audio(wav_file, out_file):
+    """Convert a WAV file to another format with ffmpeg, returning True on success"""
+    result = subprocess.run(['ffmpeg', '-loglevel', 'error', '-i', wav_file, '-y', out_file],
+                            capture_output=True, text=True)
+    return result.returncode == 0
+
 def convert_to_web_audio_formats():
     """Try to convert WAV files to MP3 and OGG using ffmpeg"""
     try:
-        import subprocess
-
         print("\n🔄 Attempting to convert with ffmpeg...")
 
-        for base_name in ['jump', 'death', 'background']:
-            wav_file = f'assets/audio/{base_name}.wav'
-            mp3_file = f'assets/audio/{base_name}.mp3'
-            ogg_file = f'assets/audio/{base_name}.ogg'
-
-            # Convert to MP3
-            result = subprocess.run(['ffmpeg', '-i', wav_file, '-y', mp3_file],
-                                  capture_output=True, text=True)
-            if result.returncode == 0:
-                print(f"✅ Created {mp3_file}")
-            else:
-                print(f"⚠️  Failed to create {mp3_file}")
+        # Each ffmpeg process is single-threaded for these short clips, so run them side by side
+        jobs = [(f'assets/audio/{base_name}.wav', f'assets/audio/{base_name}.{ext}')
+                for base_name in ['jump', 'death', 'background']
+                for ext in ['mp3', 'ogg']]
+        with ThreadPoolExecutor(max_workers=len(jobs)) as executor:
+            results = list(executor.map(lambda job: convert_audio(*job), jobs))
 
-            # Convert to OGG
-            result = subprocess.run(['ffmpeg', '-i', wav_file, '-y', ogg_file],
-                                  capture_output=True, text=True)
-            if result.returncode == 0:
-                print(f"✅ Created {ogg_file}")
+        for (_, out_file), success in zip(jobs, results):
+            if success:
+                print(f"✅ Created {out_file}")
             else:
-                print(f"⚠️  Failed to create {ogg_file}")
+                print(f"⚠️  Failed to create {out_file}")
 
         print("\n✨ Conversion complete!")
         return True
@@ -18,6 +18,13 @@ bg_color = (10, 10, 10)  # Dark background
 neon_cyan = (0, 255, 255)
 neon_pink = (255, 0, 255)
 
+# Title font, loaded once and shared by every screenshot
+try:
+    # Try to use a better font if available
+    title_font = ImageFont.truetype("/System/Library/Fonts/Helvetica.ttc", 48)
+except OSError:
+    title_font = ImageFont.load_default()
+
 def create_icon(size):
     """Create a simple icon with neon colors"""
     img = Image.new('RGB', (size, size), bg_color)
@@ -54,17 +61,17 @@ def create_icon(size):
 
     return img
 
-def create_screenshot(width, height, title):
+def create_screenshot(width, height, title, font=title_font):
     """Create a simple screenshot mockup"""
     img = Image.new('RGB', (width, height), bg_color)
     draw = ImageDraw.Draw(img)
 
-    # Draw grid pattern
+    # Draw grid pattern (RGB images have no alpha, so the grid is plain cyan)
     grid_size = 50
     for x in range(0, width, grid_size):
-        draw.line([(x, 0), (x, height)], fill=(0, 255, 255, 30), width=1)
+        draw.line([(x, 0), (x, height)], fill=neon_cyan, width=1)
     for y in range(0, height, grid_size):
-        draw.line([(0, y), (width, y)], fill=(0, 255, 255, 30), width=1)
+        draw.line([(0, y), (width, y)], fill=neon_cyan, width=1)
 
     # Draw ground line
     ground_y = height - 100
@@ -89,12 +96,6 @@ def create_screenshot(width, height, title):
     )
 
     # Add title text
-    try:
-        # Try to use a better font if available
-        font = ImageFont.truetype("/System/Library/Fonts/Helvetica.ttc", 48)
-    except:
-        font = ImageFont.load_default()
-
     text_bbox = draw.textbbox((0, 0), title, font=font)
     text_width = text_bbox[2] - text_bbox[0]
     text_height = text_bbox[3] - text_bbox[1]
@@ -115,10 +116,6 @@ for size in icon_sizes:
     icon.save(f'assets/icons/icon-{size}.png')
     print(f"Created icon-{size}.png")
 
-# Special case for icon-32 (favicon)
-icon_32 = create_icon(32)
-icon_32.save('assets/icons/icon-32.png')
-
 # Generate play button icon
 play_icon = create_icon(96)
 play_icon.save('assets/icons/play.png')
@@ -133,4 +130,4 @@ menu_screenshot = create_screenshot(1280, 720, "MAIN MENU")
 menu_screenshot.save('assets/screenshots/menu.png')
 print("Created menu.png")
 
-print("\nAll assets generated successfully!")
\ No newline at end of file
+print("\nAll assets generated successfully!")